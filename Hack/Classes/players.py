@@ -6,6 +6,10 @@ from helpers import OFFSETS
 class Crew:
     tracker = dict()
 
+    # Bumped on every color assignment so readers can tell when a crew's
+    # color changed without comparing the colors themselves
+    _color_version_counter = 0
+
     class CrewPlayer:
         """Playerstate for crew players tracking."""
 
@@ -30,12 +34,30 @@ class Crew:
         self.address = address
         self.guid = guid
         self.size = size
-        self.color = color
         self.ship = ship
         self.players = players
 
+        # CrewService hands us a fresh Crew every update, so keep the previous
+        # version if this crew's color hasn't actually changed
+        previous = Crew.tracker.get(guid)
+        if previous is not None and previous.color == color:
+            self._color = color
+            self.color_version = previous.color_version
+        else:
+            self.color = color
+
         Crew.tracker[guid] = self
 
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+        Crew._color_version_counter += 1
+        self.color_version = Crew._color_version_counter
+
 
 class Ship:
 
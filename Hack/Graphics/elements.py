@@ -1,5 +1,6 @@
 from pyglet.text import Label
 from pyglet.shapes import Rectangle
+from pyglet.sprite import Sprite
 from helpers import foreground_batch, background_batch
 
 # Outlined label
@@ -298,6 +299,34 @@ class LabelDefault:
         self._y = value
         self.label.y = value
 
+    @property
+    def position(self):
+        return self.label.position
+
+    @position.setter
+    def position(self, value):
+        if (self._x, self._y) == value:
+            return
+        self._x, self._y = value
+        self.label.position = value
+
     def delete(self):
         self.label.delete()
-        del self
\ No newline at end of file
+        del self
+
+
+# Sprite which is never scaled or rotated
+class StaticSizeSprite(Sprite):
+    def _update_position(self):
+        # Same as Sprite._update_position minus the rotation & scale paths,
+        # as this is called every time the sprite moves
+        img = self._texture
+        if not self._visible:
+            vertices = (0, 0, 0, 0, 0, 0, 0, 0)
+        else:
+            x1 = int(self._x - img.anchor_x)
+            y1 = int(self._y - img.anchor_y)
+            x2 = x1 + img.width
+            y2 = y1 + img.height
+            vertices = (x1, y1, x2, y1, x2, y2, x1, y2)
+        self._vertex_list.vertices[:] = vertices
@@ -9,6 +9,9 @@ import globals
 from helpers import OFFSETS
 from contextlib import suppress
 
+# An actors X, Y & Z coordinates, as read by _coord_builder
+COORDS_STRUCT = struct.Struct("<3f")
+
 
 class DisplayObject(metaclass=abc.ABCMeta):
     """
@@ -18,6 +21,9 @@ class DisplayObject(metaclass=abc.ABCMeta):
     considered "common" and reduces redundant code.
     """
 
+    # Subclasses may declare their own __slots__ to drop the per-instance dict
+    __slots__ = ("coord_offset", "actor_id", "to_delete", "_coord_buf")
+
     def __init__(self):
         """
         Some of our DisplayObject calls need to make memory reads, so we will
@@ -29,6 +35,9 @@ class DisplayObject(metaclass=abc.ABCMeta):
         self.actor_id = -1
         self.to_delete = False
 
+        # Reused by every _coord_builder call on this object
+        self._coord_buf = bytearray(COORDS_STRUCT.size)
+
     def _get_actor_id(self, address: int) -> int:
         """
         Function to get the AActor's ID, used to validate the ID hasn't changed
@@ -62,11 +71,10 @@ class DisplayObject(metaclass=abc.ABCMeta):
         :return: A dictionary containing the coordinate information
         for a specific actor
         """
-        actor_bytes = globals.rm.read_bytes(root_comp_ptr + offset, 24)
-        unpacked = struct.unpack("<ffffff", actor_bytes)
+        globals.rm.read_bytes_into(root_comp_ptr + offset, self._coord_buf)
+        x, y, z = COORDS_STRUCT.unpack_from(self._coord_buf)
 
-        coordinate_dict = {"x": unpacked[0] / 100, "y": unpacked[1] / 100,
-                           "z": unpacked[2] / 100}
+        coordinate_dict = {"x": x / 100, "y": y / 100, "z": z / 100}
         return coordinate_dict
 
     @abc.abstractmethod
@@ -4,19 +4,60 @@
 """
 
 import os
-from pyglet.sprite import Sprite
+import sys
+import math
+import struct
+import globals
 from pyglet.shapes import Circle
 from pyglet import image
-from helpers import calculate_distance, object_to_screen, foreground_batch, background_batch
+from pyglet.image.atlas import TextureAtlas
+from helpers import calculate_distance, object_to_screen, project_all, \
+    foreground_batch, background_batch, OFFSETS
 from mapping import ships
-from Graphics.elements import LabelDefault
+from Graphics.elements import LabelDefault, StaticSizeSprite
 from Modules import DisplayObject
 from Classes import Ship, Crew
 
 CIRCLE_SIZE = 25
-SLOOP_ICON = image.load(os.path.join(os.getcwd(), 'Graphics', 'Images', 'Sloop_icon.png'))
-BRIGANTINE_ICON = image.load(os.path.join(os.getcwd(), 'Graphics', 'Images', 'Brigantine_icon.png'))
-GALLEON_ICON = image.load(os.path.join(os.getcwd(), 'Graphics', 'Images', 'Galleon_icon.png'))
+IMAGES_DIR = os.path.join(os.getcwd(), 'Graphics', 'Images')
+
+# All ship icons live in one texture atlas, so every icon sprite shares the
+# same texture & group and the batch draws them without rebinding textures
+ICON_ATLAS = TextureAtlas(256, 64)
+SLOOP_ICON = ICON_ATLAS.add(image.load(os.path.join(IMAGES_DIR, 'Sloop_icon.png')))
+BRIGANTINE_ICON = ICON_ATLAS.add(image.load(os.path.join(IMAGES_DIR, 'Brigantine_icon.png')))
+GALLEON_ICON = ICON_ATLAS.add(image.load(os.path.join(IMAGES_DIR, 'Galleon_icon.png')))
+
+# Screen-space offsets used every frame, computed once instead of per update
+_HALF = CIRCLE_SIZE * 0.5
+_ICON_OFF = CIRCLE_SIZE * 1.45
+_TEXT_DX = _HALF + 10
+_TEXT_DY = _HALF - 30
+
+# Per ship, update_all reads the actor ID followed by the XYZ coordinates
+_FRAME_READ = struct.Struct("<i3f")
+
+# Ships swap between their "Near" and far actors at 1750m, compared squared
+_SWITCH_DSQ = 1750 * 1750
+
+
+def _icon_for(name: str):
+    """
+    Picks the icon to display for a ship based on its readable name
+    """
+    if "Galleon" in name:
+        return GALLEON_ICON
+    if "Brig" in name:
+        return BRIGANTINE_ICON
+    return SLOOP_ICON
+
+
+# (name, is "Near" actor, icon) for each ship actor, resolved once from our
+# mapping rather than on every ship we create
+SHIP_META = {
+    raw: (sys.intern(meta["Name"]), "Near" in meta["Name"], _icon_for(meta["Name"]))
+    for raw, meta in ships.items()
+}
 
 
 class ShipModule(DisplayObject):
@@ -24,6 +65,12 @@ class ShipModule(DisplayObject):
     Class to generate information for a ship object in memory
     """
 
+    __slots__ = ("address", "actor_root_comp_ptr", "my_coords", "raw_name",
+                 "name", "_name_prefix", "_is_near", "_icon", "coords", "distance",
+                 "screen_coords", "crew_guid", "text_str", "text_render",
+                 "circle", "icon", "_last_pos", "_last_vis", "_color_ver",
+                 "_last_raw_coords", "_last_cam", "_projection")
+
     def __init__(self, actor_id, address, raw_name, my_coords):
         """
         Upon initialization of this class, we immediately initialize the
@@ -31,8 +78,9 @@ class ShipModule(DisplayObject):
 
         We then set our class variables and perform all of our info collecting
         functions, like finding the actors base address and converting the
-        "raw" name to a more readable name per our Mappings. We also create
-        a circle and label and add it to our batch for display to the screen.
+        "raw" name to a more readable name per our Mappings. Once the ship is
+        on screen we also create a circle, icon and label and add them to our
+        batch for display to the screen.
 
         All of this data represents a "Ship". If you want to add more, you will
         need to add another class variable under __init__ and in the update()
@@ -53,7 +101,8 @@ class ShipModule(DisplayObject):
         self.raw_name = raw_name
 
         # Generate our Ship's info
-        self.name = ships.get(self.raw_name).get("Name")
+        self.name, self._is_near, self._icon = SHIP_META[self.raw_name]
+        self._name_prefix = f"{self.name} - "
         self.coords = self._coord_builder(self.actor_root_comp_ptr,
                                           self.coord_offset)
         self.distance = calculate_distance(self.coords, self.my_coords)
@@ -63,49 +112,63 @@ class ShipModule(DisplayObject):
 
         # All of our actual display information & rendering
         self.text_str = self._built_text_string()
-        self.text_render = self._build_text_render()
-        self.circle = self._build_circle_render()
-        self.icon = self._build_icon_render()
+        self.text_render = None
+        self.circle = None
+        self.icon = None
+
+        # Last values pushed to pyglet, so update() only writes what changed
+        self._last_pos = None
+        self._last_vis = False
+        self._color_ver = -1
+
+        if self.screen_coords:
+            self._build_renders()
+
+        # Raw coordinates, camera & (screen coordinates, squared distance)
+        # from the last time update_all projected this ship
+        self._last_raw_coords = None
+        self._last_cam = None
+        self._projection = (False, 0.0)
 
         # Used to track if the display object needs to be removed
         self.to_delete = False
-        
 
-    def _build_icon_render(self) -> Sprite:
+    def _build_renders(self):
         """
-        Creates an icon based on ship type
+        Creates our circle, icon and label. Deferred until the ship is first
+        on screen, so ships that spawn far away never take up batch space
         """
-        if "Galleon" in self.name:
-            ship_type = GALLEON_ICON
-        elif "Brig" in self.name:
-            ship_type = BRIGANTINE_ICON
-        else:
-            ship_type = SLOOP_ICON
+        self.text_render = self._build_text_render()
+        self.circle = self._build_circle_render()
+        self.icon = self._build_icon_render()
 
-        if self.screen_coords:
-            return Sprite(ship_type, self.screen_coords[0] - CIRCLE_SIZE, self.screen_coords[1] - CIRCLE_SIZE,
-                          batch=foreground_batch)
+        # New render objects start out visible with no color of our own
+        self._last_pos = None
+        self._last_vis = True
+        self._color_ver = -1
 
-        return Sprite(ship_type, 0, 0, batch=foreground_batch)
+    def _build_icon_render(self) -> StaticSizeSprite:
+        """
+        Creates an icon based on ship type
+        """
+        return StaticSizeSprite(self._icon, self.screen_coords[0] - CIRCLE_SIZE, self.screen_coords[1] - CIRCLE_SIZE,
+                                batch=foreground_batch)
 
     def _build_circle_render(self) -> Circle:
         """
-        Creates a circle located at the screen coordinates (if they exist).
+        Creates a circle located at the screen coordinates.
         Uses the color specified in our globals w/ a size of 10px radius.
         Assigns the object to our batch & group
         """
-        if self.screen_coords:
-            return Circle(self.screen_coords[0] - CIRCLE_SIZE/2, self.screen_coords[1] - CIRCLE_SIZE/2,
-                          CIRCLE_SIZE, color=(255, 255, 255), batch=background_batch)
-
-        return Circle(0, 0, CIRCLE_SIZE, color=(255, 255, 255), batch=background_batch)
+        return Circle(self.screen_coords[0] - _HALF, self.screen_coords[1] - _HALF,
+                      CIRCLE_SIZE, color=(255, 255, 255), batch=background_batch)
 
     def _built_text_string(self) -> str:
         """
         Generates a string used for rendering. Separate function in the event
         you need to add more data (Sunk %, hole count, etc)
         """
-        return f"{self.name} - {self.distance}m"
+        return self._name_prefix + str(self.distance) + "m"
 
     def _build_text_render(self) -> LabelDefault:
         """
@@ -117,13 +180,80 @@ class ShipModule(DisplayObject):
         :rtype: LabelDefault
         :return: What text we want displayed next to the ship
         """
-        if self.screen_coords:
-            return LabelDefault(self.text_str,
-                         x=self.screen_coords[0] + CIRCLE_SIZE / 2 + 10,
-                         y=self.screen_coords[1] + CIRCLE_SIZE / 2 - 30,
-                         batch=foreground_batch)
+        return LabelDefault(self.text_str,
+                            x=self.screen_coords[0] + _TEXT_DX,
+                            y=self.screen_coords[1] + _TEXT_DY,
+                            batch=foreground_batch)
 
-        return LabelDefault(self.text_str, x=0, y=0, batch=foreground_batch)
+    @classmethod
+    def update_all(cls, ship_modules: list, my_coords: dict):
+        """
+        Updates every ship we are tracking in one go. Memory for all ships is
+        read into one buffer, and all of the projection and distance math is
+        done in a single project_all pass before the results are handed back
+        to each ship to display
+
+        :param ship_modules: The ShipModule objects to update
+        :param my_coords: a dictionary of the local players coordinates
+        """
+        # Gather every ship's actor ID and coordinates in a single read call
+        actor_id_offset = OFFSETS.get('Actor.actorId')
+        addresses = []
+        for ship in ship_modules:
+            addresses.append(ship.address + actor_id_offset)
+            addresses.append(ship.actor_root_comp_ptr + ship.coord_offset)
+        raw = globals.rm.batch_read(addresses, [4, 12] * len(ship_modules))
+
+        camera = my_coords["camera"]
+
+        live = []
+        moved = []
+        for index, ship in enumerate(ship_modules):
+            actor_id, x, y, z = _FRAME_READ.unpack_from(raw, index * _FRAME_READ.size)
+            if actor_id != ship.actor_id:
+                ship.to_delete = True
+                ship._delete()
+                continue
+
+            ship.my_coords = my_coords
+            live.append(ship)
+
+            # A ship that hasn't moved, seen from a camera that hasn't moved
+            # (anchored ships while we stand still), projects to the same spot
+            # as last frame, so only the rest get projected again
+            if camera != ship._last_cam or (x, y, z) != ship._last_raw_coords:
+                ship._last_raw_coords = (x, y, z)
+                ship._last_cam = camera
+                ship.coords = {"x": x / 100, "y": y / 100, "z": z / 100}
+                moved.append(ship)
+
+        projected = project_all(camera, [ship.coords for ship in moved])
+        for ship, projection in zip(moved, projected):
+            ship._projection = projection
+
+        # Work on parallel per-ship lists from here on, rather than going back
+        # through each ship's attributes for every step
+        screens = [ship._projection[0] for ship in live]
+        dsqs = [ship._projection[1] for ship in live]
+
+        # Ships have two actors dependant on distance. This switches them
+        # seamlessly at 1750m, only showing whichever is on screen and in range
+        visible = [bool(screen_coords) and not (ship._is_near ^ (new_dsq <= _SWITCH_DSQ))
+                   for ship, screen_coords, new_dsq in zip(live, screens, dsqs)]
+
+        # Render objects are only created the first time a ship is on screen
+        for ship, screen_coords in zip(live, screens):
+            if screen_coords and ship.circle is None:
+                ship.screen_coords = screen_coords
+                ship._build_renders()
+
+        # Only ships whose visibility flipped since last frame touch pyglet
+        for ship, shown in zip(live, visible):
+            if shown != ship._last_vis:
+                ship._set_visible(shown)
+
+        for ship, screen_coords, new_dsq in zip(live, screens, dsqs):
+            ship._apply_update(screen_coords, new_dsq)
 
     def update(self, my_coords: dict):
         """
@@ -135,63 +265,66 @@ class ShipModule(DisplayObject):
         2. See if any data has changed
         3. Update the data if something has changed
 
-        In theory if all data is the same, we could *not* update our Label's
-        text, therefore saving resources. Not implemented, but a possibility
+        Our main loop updates all ships together through update_all, this is
+        the single-ship equivalent
         """
-        if self._get_actor_id(self.address) != self.actor_id:
-            self.to_delete = True
-            self.circle.delete()
-            self.icon.delete()
-            self.text_render.delete()
-            return
+        self.update_all([self], my_coords)
 
-        self.my_coords = my_coords
-        self.coords = self._coord_builder(self.actor_root_comp_ptr,
-                                          self.coord_offset)
-        new_distance = calculate_distance(self.coords, self.my_coords)
+    def _apply_update(self, screen_coords, new_dsq: float):
+        """
+        Displays the result of this frames projection for our ship.
 
-        self.screen_coords = object_to_screen(self.my_coords, self.coords)
+        Positions, colors and text are only pushed to pyglet when they differ
+        from what we wrote last frame, as every write costs a vertex list
+        update. Visibility is handled by update_all
 
-        if self.screen_coords:
-            # Ships have two actors dependant on distance. This switches them
-            # seamlessly at 1750m
-            if "Near" in self.name and new_distance > 1750:
-                self.text_render.visible = False
-                self.circle.visible = False
-                self.icon.visible = False
-            elif "Near" not in self.name and new_distance < 1750:
-                self.text_render.visible = False
-                self.circle.visible = False
-                self.icon.visible = False
-            else:
-                self.text_render.visible = True
-                self.icon.visible = True
-                self.circle.visible = True
-
-            # Update the position of our circle and text
-            self.circle.x = self.screen_coords[0] - CIRCLE_SIZE / 2
-            self.circle.y = self.screen_coords[1] - CIRCLE_SIZE / 2
-            self.icon.x = self.screen_coords[0] - CIRCLE_SIZE * 1.45
-            self.icon.y = self.screen_coords[1] - CIRCLE_SIZE * 1.45
-            self.text_render.x = self.screen_coords[0] + CIRCLE_SIZE / 2 + 10
-            self.text_render.y = self.screen_coords[1] + CIRCLE_SIZE / 2 - 30
-   
-            # Update ship color if we know the crew
-            if self.crew_guid in Crew.tracker:
-                self.circle.color = Crew.tracker[self.crew_guid].color[:3]
-
-            # Update our text to reflect out new distance
+        :param screen_coords: Our screen coordinates, or False if off-screen
+        :param new_dsq: The squared distance from the local player in meters
+        """
+        self.screen_coords = screen_coords
+        if not screen_coords:
+            return
+
+        # Local references so the writes below skip repeated lookups on self
+        circle = self.circle
+        text_render = self.text_render
+        sx, sy = screen_coords
+
+        # Update the position of our circle and text, one write per object
+        position = (sx, sy)
+        if position != self._last_pos:
+            circle.position = (sx - _HALF, sy - _HALF)
+            self.icon.position = (sx - _ICON_OFF, sy - _ICON_OFF)
+            text_render.position = (sx + _TEXT_DX, sy + _TEXT_DY)
+            self._last_pos = position
+
+        # Update ship color if we know the crew and its color has changed
+        crew = Crew.tracker.get(self.crew_guid)
+        if crew is not None and crew.color_version != self._color_ver:
+            circle.color = crew.color[:3]
+            self._color_ver = crew.color_version
+
+        # Update our text to reflect out new distance, only taking the
+        # square root once we know the text is actually displayed. The
+        # label only changes when the whole-meter distance does
+        new_distance = int(math.sqrt(new_dsq))
+        if new_distance != self.distance:
             self.distance = new_distance
             self.text_str = self._built_text_string()
-            self.text_render.text = self.text_str
+            text_render.text = self.text_str
 
-        else:
-            # if it isn't on our screen, set it to invisible to save resources
-            self.text_render.visible = False
-            self.circle.visible = False
-            self.icon.visible = False
+    def _set_visible(self, visible: bool):
+        """
+        Shows or hides all of our render objects. Only called by update_all
+        when the visibility has changed since the last frame
+        """
+        self.text_render.visible = self.icon.visible = self.circle.visible = visible
+        self._last_vis = visible
     
     def _delete(self):
-        self.text_render.delete()
-        self.circle.delete()
-        self.icon.delete()
+        for render in (self.text_render, self.circle, self.icon):
+            if render is not None:
+                render.delete()
+        self.text_render = None
+        self.circle = None
+        self.icon = None
@@ -8,6 +8,7 @@ import json
 import logging
 import win32gui
 import os
+from typing import NamedTuple
 from pyglet.graphics import Batch
 
 
@@ -59,6 +60,38 @@ def dot(array_1: tuple, array_2: tuple) -> float:
            * array_2[1] + array_1[2] * array_2[2]
 
 
+class CameraState(NamedTuple):
+    """
+    Everything object_to_screen needs to know about the local camera. Built
+    once per frame so each actor only pays for its own projection
+    """
+    x: float
+    y: float
+    z: float
+    axis_x: tuple
+    axis_y: tuple
+    axis_z: tuple
+    focal: float
+
+
+def build_camera(player: dict) -> CameraState:
+    """
+    Precomputes the camera rotation axes and focal length from the players
+    coordinate dictionary
+
+    :param player: The player coordinate dictionary
+    :rtype: CameraState
+    :return: The camera state to hand to object_to_screen_fast
+    """
+    temp = make_v_matrix((player.get("cam_x"), player.get("cam_y"),
+                          player.get("cam_z")))
+    tmp_fov = math.tan(player.get("fov") * math.pi / 360)
+
+    return CameraState(player.get("x"), player.get("y"), player.get("z"),
+                       tuple(temp[0]), tuple(temp[1]), tuple(temp[2]),
+                       (SOT_WINDOW_W / 2) / tmp_fov)
+
+
 def object_to_screen(player: dict, actor: dict) -> tuple:
     """
     Using the player and an actors coordinates, determine where on the screen
@@ -67,6 +100,9 @@ def object_to_screen(player: dict, actor: dict) -> tuple:
     Python-converted version of Gummy's External SoT v2 WorldToScreen method:
     (No Longer Avail; Need Source)
 
+    Reuses the per-frame camera stored under "camera" in the player dict if
+    there is one, otherwise builds it on the spot
+
     :param player: The player coordinate dictionary
     :param actor: An actor coordinate dictionary
     :rtype: tuple
@@ -74,39 +110,50 @@ def object_to_screen(player: dict, actor: dict) -> tuple:
     on screen
     """
     try:
-        player_camera = (player.get("cam_x"), player.get("cam_y"),
-                         player.get("cam_z"))
-        temp = make_v_matrix(player_camera)
+        camera = player.get("camera") or build_camera(player)
+    except Exception as w2s_error:
+        logger.error(f"Couldn't generate screen coordinates for entity: {w2s_error}")
+        return None
+
+    return object_to_screen_fast(camera, actor)
+
+
+def object_to_screen_fast(camera: CameraState, actor: dict) -> tuple:
+    """
+    Projects an actors coordinates to the screen with an already built
+    camera, see object_to_screen
 
-        v_axis_x = (temp[0][0], temp[0][1], temp[0][2])
-        v_axis_y = (temp[1][0], temp[1][1], temp[1][2])
-        v_axis_z = (temp[2][0], temp[2][1], temp[2][2])
+    :param camera: The CameraState for the current frame
+    :param actor: An actor coordinate dictionary
+    :rtype: tuple
+    :return: tuple of x and y screen coordinates to display where the actor is
+    on screen
+    """
+    try:
+        d_x = actor.get("x") - camera.x
+        d_y = actor.get("y") - camera.y
+        d_z = actor.get("z") - camera.z
 
-        v_delta = (actor.get("x") - player.get("x"),
-                   actor.get("y") - player.get("y"),
-                   actor.get("z") - player.get("z"))
-        v_transformed = [dot(v_delta, v_axis_y),
-                         dot(v_delta, v_axis_z),
-                         dot(v_delta, v_axis_x)]
+        axis = camera.axis_x
+        depth = d_x * axis[0] + d_y * axis[1] + d_z * axis[2]
 
         # Credit https://github.com/AlexBurneikis
         # No valid screen coordinates if its behind us
-        if v_transformed[2] < 1.0:
+        if depth < 1.0:
             return False
 
-        fov = player.get("fov")
+        axis = camera.axis_y
+        v_x = d_x * axis[0] + d_y * axis[1] + d_z * axis[2]
+        axis = camera.axis_z
+        v_y = d_x * axis[0] + d_y * axis[1] + d_z * axis[2]
+
         screen_center_x = SOT_WINDOW_W / 2
         screen_center_y = SOT_WINDOW_H / 2
 
-        tmp_fov = math.tan(fov * math.pi / 360)
-
-        x = screen_center_x + v_transformed[0] * (screen_center_x / tmp_fov) \
-            / v_transformed[2]
+        x = screen_center_x + v_x * camera.focal / depth
         if x > SOT_WINDOW_W or x < 0:
             return False
-        y = screen_center_y - v_transformed[1] * \
-            (screen_center_x / tmp_fov) \
-            / v_transformed[2]
+        y = screen_center_y - v_y * camera.focal / depth
         if y > SOT_WINDOW_H or y < 0:
             return False
 
@@ -115,6 +162,53 @@ def object_to_screen(player: dict, actor: dict) -> tuple:
         logger.error(f"Couldn't generate screen coordinates for entity: {w2s_error}")
 
 
+def project_all(camera: CameraState, actors: list) -> list:
+    """
+    Batch version of object_to_screen_fast which also returns the squared
+    distance to the camera. Camera fields are unpacked once for the whole
+    list rather than once per actor
+
+    :param camera: The CameraState for the current frame
+    :param actors: A list of actor coordinate dictionaries
+    :rtype: list
+    :return: A (screen coordinates or False, squared distance) tuple for each
+    actor, in the same order as actors
+    """
+    cam_x, cam_y, cam_z = camera.x, camera.y, camera.z
+    ax_0, ax_1, ax_2 = camera.axis_x
+
+    # Fold the focal length into the screen axes once, rather than scaling
+    # every actor's projection by it
+    focal = camera.focal
+    ay_0, ay_1, ay_2 = (axis * focal for axis in camera.axis_y)
+    az_0, az_1, az_2 = (axis * focal for axis in camera.axis_z)
+    screen_center_x = SOT_WINDOW_W / 2
+    screen_center_y = SOT_WINDOW_H / 2
+
+    results = []
+    add_result = results.append
+    for actor in actors:
+        d_x = actor["x"] - cam_x
+        d_y = actor["y"] - cam_y
+        d_z = actor["z"] - cam_z
+        dsq = d_x * d_x + d_y * d_y + d_z * d_z
+
+        # No valid screen coordinates if its behind us
+        depth = d_x * ax_0 + d_y * ax_1 + d_z * ax_2
+        if depth < 1.0:
+            add_result((False, dsq))
+            continue
+
+        x = screen_center_x + (d_x * ay_0 + d_y * ay_1 + d_z * ay_2) / depth
+        y = screen_center_y - (d_x * az_0 + d_y * az_1 + d_z * az_2) / depth
+        if 0 <= x <= SOT_WINDOW_W and 0 <= y <= SOT_WINDOW_H:
+            add_result(((int(x), int(SOT_WINDOW_H - y)), dsq))
+        else:
+            add_result((False, dsq))
+
+    return results
+
+
 def make_v_matrix(rot: tuple) -> list:
     """
     Builds data around how the camera is currently rotated.
@@ -171,4 +265,4 @@ def calculate_distance(obj_to: dict, obj_from: dict) -> int:
     try:
         return int(distance)
     except:
-        return 0
\ No newline at end of file
+        return 0
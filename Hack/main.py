@@ -58,6 +58,22 @@ def update_globals(_, global_module: GlobalModule):
     global_module.update()
 
 
+def delete_display_objects(doomed: list):
+    """
+    Deletes a group of display objects and drops all of them from our display
+    objects in a single pass, rather than a list.remove() per object
+    """
+    if not doomed:
+        return
+
+    for display_ob in doomed:
+        display_ob.delete()
+
+    doomed_ids = {id(display_ob) for display_ob in doomed}
+    smr.display_objects = [display_ob for display_ob in smr.display_objects
+                           if id(display_ob) not in doomed_ids]
+
+
 def update_graphics(_):
     """
     Our main graphical loop which updates all of our "interesting" items.
@@ -70,13 +86,16 @@ def update_graphics(_):
 
     # Delete old objects
     if shared_list_to_delete:
-        for display_ob in smr.display_objects:
-            if display_ob.actor_id in shared_list_to_delete:
-                smr.display_objects.remove(display_ob)
-                display_ob.delete()
+        # Copy the shared list once instead of querying the manager process
+        # for every object, then drop only what we copied
+        keys = list(shared_list_to_delete)
+        del shared_list_to_delete[:len(keys)]
 
-        while shared_list_to_delete:
-            key = shared_list_to_delete.pop()
+        doomed_keys = set(keys)
+        delete_display_objects([display_ob for display_ob in smr.display_objects
+                                if display_ob.actor_id in doomed_keys])
+
+        for key in keys:
             raw_name = key.split('__')[1]
             if raw_name.startswith('local_handler_'):
                 Player.local_player_handles = None
@@ -122,22 +141,22 @@ def update_graphics(_):
                 raw_name = args[-1].replace("local_handler_", '')
                 Player.local_player_handles = raw_name
 
-    # Initialize a list of items which are no longer valid in this loop
-    to_remove = []
+    # Ships are updated together so their projection is done in one pass
+    ships = []
 
     # For each actor that is stored from the most recent run of read_actors
     for actor in smr.display_objects:
+        if isinstance(actor, ShipModule):
+            ships.append(actor)
+            continue
+
         # Call the update function within the actor object
         actor.update(smr.my_coords)
 
-        # If the actor isn't the actor we expect (per .update), prepare to nuke
-        if actor.to_delete:
-            to_remove.append(actor)
+    ShipModule.update_all(ships, smr.my_coords)
 
-    # Clean up any items which arent valid anymore
-    for removable in to_remove:
-        removable.delete()
-        smr.display_objects.remove(removable)
+    # Clean up any items which arent valid anymore (per .update)
+    delete_display_objects([actor for actor in smr.display_objects if actor.to_delete])
 
 
 
@@ -263,6 +263,44 @@ class ReadWriteMemory:
         raw = buff.raw
         return raw
 
+    def read_bytes_into(self, address: int, buffer: bytearray) -> bytearray:
+        """
+        Read enough bytes at a specific address to fill an existing buffer,
+        letting callers reuse one buffer instead of allocating per read
+        :param address: address at which to read a number of bytes
+        :param buffer: writable buffer to read len(buffer) bytes into
+        """
+        if not isinstance(address, int):
+            raise TypeError(f'Address must be int: {address}')
+        size = len(buffer)
+        bytes_read = ctypes.c_size_t()
+        ReadProcessMemory(self.handle, ctypes.c_void_p(address),
+                          (ctypes.c_char * size).from_buffer(buffer), size,
+                          ctypes.byref(bytes_read))
+        return buffer
+
+    def batch_read(self, addresses: list, sizes: list) -> bytes:
+        """
+        Read a number of regions into one combined buffer, back to back in
+        the order they were given. ReadProcessMemory can only read a single
+        contiguous region, so each region is still its own call, but they all
+        share one buffer rather than allocating a new one per read
+        :param addresses: addresses at which to read each region
+        :param sizes: count of bytes to read for each region
+        """
+        buff = ctypes.create_string_buffer(sum(sizes))
+        buff_address = ctypes.addressof(buff)
+        bytes_read = ctypes.c_size_t()
+        offset = 0
+        for address, size in zip(addresses, sizes):
+            if not isinstance(address, int):
+                raise TypeError(f'Address must be int: {address}')
+            ReadProcessMemory(self.handle, ctypes.c_void_p(address),
+                              ctypes.c_void_p(buff_address + offset), size,
+                              ctypes.byref(bytes_read))
+            offset += size
+        return buff.raw
+
     def read_int(self, address: int):
         """
         :param address: address at which to read a number of bytes
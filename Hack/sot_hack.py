@@ -9,7 +9,7 @@ import logging
 import globals
 from memory_helper import ReadWriteMemory
 from mapping import ship_keys, world_events_keys
-from helpers import OFFSETS, CONFIG, logger
+from helpers import OFFSETS, CONFIG, logger, build_camera
 from Modules import DisplayObject
 from Classes.players import Player
 
@@ -244,6 +244,10 @@ class SoTMemoryReader:
             + OFFSETS.get('CameraCacheEntry.MinimalViewInfo'),
             fov=True)
 
+        # Camera rotation/FoV math is shared by every actor on screen, so
+        # build it once per frame rather than once per object_to_screen call
+        self.my_coords["camera"] = build_camera(self.my_coords)
+
     def _coord_builder(self, actor_address: int, offset=0x78, camera=True,
                        fov=False) -> dict:
         """